@@ -140,46 +140,112 @@ class Player:
             pygame.draw.rect(screen, RED, (self.x + 5, self.y - 8, cooldown_bar_width, 4))
             pygame.draw.rect(screen, GREEN, (self.x + 5, self.y - 8, cooldown_bar_width * cooldown_progress, 4))
 
+# Ball type indicator drawing hooks
+def draw_bomb_indicator(screen, ball):
+    # Draw explosion symbol
+    pygame.draw.line(screen, RED, (int(ball.x - 5), int(ball.y)), (int(ball.x + 5), int(ball.y)), 2)
+    pygame.draw.line(screen, RED, (int(ball.x), int(ball.y - 5)), (int(ball.x), int(ball.y + 5)), 2)
+
+def draw_quick_indicator(screen, ball):
+    # Draw speed lines
+    pygame.draw.line(screen, BLACK, (int(ball.x - 8), int(ball.y - 3)), (int(ball.x - 4), int(ball.y - 3)), 2)
+    pygame.draw.line(screen, BLACK, (int(ball.x - 8), int(ball.y + 3)), (int(ball.x - 4), int(ball.y + 3)), 2)
+
+def draw_slow_indicator(screen, ball):
+    # Draw ZZZ for sleep
+    font = pygame.font.Font(None, 12)
+    zzz_text = font.render("Z", True, BLACK)
+    screen.blit(zzz_text, (int(ball.x + 8), int(ball.y - 8)))
+
+# Ball type scoring hooks, called as hook(game, x, y) after the ball is removed
+def bomb_on_score(game, x, y):
+    game.create_shockwave(x, y)
+
+class BallType:
+    def __init__(self, name, color, physics_multiplier=1.0, wall_damping=BOUNCE_DAMPING,
+                 floor_damping=0.8, max_floor_bounces=1, spawn_weight=1,
+                 on_score=None, draw_indicator=None):
+        self.name = name
+        self.type_id = -1  # Assigned by register_ball_type
+        self.color = color
+        self.physics_multiplier = physics_multiplier
+        self.wall_damping = wall_damping
+        self.floor_damping = floor_damping
+        self.max_floor_bounces = max_floor_bounces
+        self.spawn_weight = spawn_weight
+        self.on_score = on_score
+        self.draw_indicator = draw_indicator
+        
+        # Precomputed per-frame factors so Ball.update only does lookups
+        self.gravity_step = GRAVITY * 0.5 * physics_multiplier
+        self.step = physics_multiplier
+
+# Ball type registry: BALL_TYPES is indexed by integer type ID
+BALL_TYPES = []
+BALL_TYPE_IDS = {}  # Name -> type ID
+BALL_SPAWN_IDS = []  # Type IDs that can spawn randomly
+BALL_SPAWN_WEIGHTS = []  # Matching spawn weights
+
+def register_ball_type(ball_type):
+    if ball_type.name in BALL_TYPE_IDS:
+        raise ValueError(f"Ball type {ball_type.name!r} is already registered")
+    ball_type.type_id = len(BALL_TYPES)
+    BALL_TYPES.append(ball_type)
+    BALL_TYPE_IDS[ball_type.name] = ball_type.type_id
+    if ball_type.spawn_weight > 0:
+        BALL_SPAWN_IDS.append(ball_type.type_id)
+        BALL_SPAWN_WEIGHTS.append(ball_type.spawn_weight)
+    return ball_type.type_id
+
+def random_ball_type_id():
+    return random.choices(BALL_SPAWN_IDS, BALL_SPAWN_WEIGHTS)[0]
+
+REGULAR = register_ball_type(BallType("regular", WHITE))
+BOMB = register_ball_type(BallType("bomb", (255, 100, 0),  # Orange/red
+                                   on_score=bomb_on_score, draw_indicator=draw_bomb_indicator))
+QUICK = register_ball_type(BallType("quick", (255, 255, 0),  # Yellow
+                                    physics_multiplier=2.0,  # Faster physics
+                                    draw_indicator=draw_quick_indicator))
+SLOW = register_ball_type(BallType("slow", (100, 100, 255),  # Light blue
+                                   physics_multiplier=0.5,  # Slower physics
+                                   draw_indicator=draw_slow_indicator))
+
 class Ball:
-    def __init__(self, x, y, ball_type="regular"):
+    def __init__(self, x, y, ball_type=REGULAR):
         self.x = x
         self.y = y
         self.radius = 15
         self.vel_x = random.choice([-5, 5])
         self.vel_y = -8
         self.floor_bounces = 0  # Track how many times ball has bounced off floor
-        self.max_floor_bounces = 1  # Ball can bounce once before being removed
         
         # Ball type and properties
-        self.ball_type = ball_type
-        self.setup_ball_type()
-        
-    def setup_ball_type(self):
-        if self.ball_type == "regular":
-            self.color = WHITE
-            self.physics_multiplier = 1.0
-        elif self.ball_type == "bomb":
-            self.color = (255, 100, 0)  # Orange/red
-            self.physics_multiplier = 1.0
-        elif self.ball_type == "quick":
-            self.color = (255, 255, 0)  # Yellow
-            self.physics_multiplier = 2.0  # Faster physics
-        elif self.ball_type == "slow":
-            self.color = (100, 100, 255)  # Light blue
-            self.physics_multiplier = 0.5  # Slower physics
+        self.setup_ball_type(ball_type)
+        
+    def setup_ball_type(self, ball_type):
+        # Accept either a registered type ID or a type name
+        if isinstance(ball_type, str):
+            ball_type = BALL_TYPE_IDS[ball_type]
+        self.type_id = ball_type
+        self.kind = BALL_TYPES[ball_type]
+        self.ball_type = self.kind.name
+        self.color = self.kind.color
+        self.physics_multiplier = self.kind.physics_multiplier
+        self.max_floor_bounces = self.kind.max_floor_bounces
         
     def update(self):
-        # Apply gravity with physics multiplier
-        gravity_effect = GRAVITY * 0.5 * self.physics_multiplier
-        self.vel_y += gravity_effect
+        kind = self.kind
+        
+        # Apply precomputed gravity for this ball type
+        self.vel_y += kind.gravity_step
         
-        # Update position with physics multiplier
-        self.x += self.vel_x * self.physics_multiplier
-        self.y += self.vel_y * self.physics_multiplier
+        # Update position with precomputed step factor
+        self.x += self.vel_x * kind.step
+        self.y += self.vel_y * kind.step
         
         # Screen boundaries
         if self.x - self.radius <= 0 or self.x + self.radius >= SCREEN_WIDTH:
-            self.vel_x *= -BOUNCE_DAMPING
+            self.vel_x *= -kind.wall_damping
             if self.x - self.radius <= 0:
                 self.x = self.radius
             else:
@@ -192,7 +258,7 @@ class Ball:
             # Only bounce if we haven't used up our bounces AND we're moving downward
             if self.floor_bounces < self.max_floor_bounces and self.vel_y > 0:
                 # Bounce off floor like normal (flip velocity)
-                self.vel_y = -self.vel_y * 0.8  # Normal bounce with slight energy loss
+                self.vel_y = -self.vel_y * kind.floor_damping  # Normal bounce with slight energy loss
                 self.floor_bounces += 1
             elif self.vel_y > 0:
                 # Stop the ball if it has no bounces left
@@ -274,33 +340,21 @@ class Ball:
             other_ball.vel_x -= impulse * nx
             other_ball.vel_y -= impulse * ny
         
-    def reset(self, x, y, ball_type="regular"):
+    def reset(self, x, y, ball_type=REGULAR):
         self.x = x
         self.y = y
         self.vel_x = random.choice([-5, 5])
         self.vel_y = -8
         self.floor_bounces = 0  # Reset bounce counter
-        self.ball_type = ball_type
-        self.setup_ball_type()
+        self.setup_ball_type(ball_type)
         
     def draw(self, screen):
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
         pygame.draw.circle(screen, BLACK, (int(self.x), int(self.y)), self.radius, 2)
         
         # Draw ball type indicator
-        if self.ball_type == "bomb":
-            # Draw explosion symbol
-            pygame.draw.line(screen, RED, (int(self.x - 5), int(self.y)), (int(self.x + 5), int(self.y)), 2)
-            pygame.draw.line(screen, RED, (int(self.x), int(self.y - 5)), (int(self.x), int(self.y + 5)), 2)
-        elif self.ball_type == "quick":
-            # Draw speed lines
-            pygame.draw.line(screen, BLACK, (int(self.x - 8), int(self.y - 3)), (int(self.x - 4), int(self.y - 3)), 2)
-            pygame.draw.line(screen, BLACK, (int(self.x - 8), int(self.y + 3)), (int(self.x - 4), int(self.y + 3)), 2)
-        elif self.ball_type == "slow":
-            # Draw ZZZ for sleep
-            font = pygame.font.Font(None, 12)
-            zzz_text = font.render("Z", True, BLACK)
-            screen.blit(zzz_text, (int(self.x + 8), int(self.y - 8)))
+        if self.kind.draw_indicator:
+            self.kind.draw_indicator(screen, self)
 
 class Game:
     def __init__(self):
@@ -346,9 +400,7 @@ class Game:
         self.explosions = []  # List to store active explosions
         
     def create_random_ball(self, x, y):
-        ball_types = ["regular", "bomb", "quick", "slow"]
-        ball_type = random.choice(ball_types)
-        return Ball(x, y, ball_type)
+        return Ball(x, y, random_ball_type_id())
     
     def create_shockwave(self, bomb_x, bomb_y):
         # Apply shockwave effect to all other balls and players, store knockback vectors
@@ -440,7 +492,7 @@ class Game:
         # Check balls that have used all bounces and are on ground
         balls_to_remove = []
         point_scored = False
-        bomb_positions = []  # Store positions of bomb balls for shockwave
+        score_effects = []  # Store on-score hooks to run once balls are removed
         
         for i, ball in enumerate(self.balls):
             # Remove ball if it has used all floor bounces and is touching ground
@@ -448,9 +500,9 @@ class Game:
                 ball.floor_bounces >= ball.max_floor_bounces and
                 abs(ball.vel_y) < 1):  # Make sure ball is settled on ground
                 
-                # Store bomb position for shockwave
-                if ball.ball_type == "bomb":
-                    bomb_positions.append((ball.x, ball.y))
+                # Store on-score effect (e.g. bomb shockwave)
+                if ball.kind.on_score:
+                    score_effects.append((ball.kind.on_score, ball.x, ball.y))
                 
                 if ball.x < SCREEN_WIDTH // 2:
                     # Point for player 2
@@ -469,9 +521,9 @@ class Game:
         for i in reversed(balls_to_remove):
             del self.balls[i]
             
-        # Create shockwaves from bomb balls
-        for bomb_x, bomb_y in bomb_positions:
-            self.create_shockwave(bomb_x, bomb_y)
+        # Run on-score effects (e.g. shockwaves from bomb balls)
+        for on_score, x, y in score_effects:
+            on_score(self, x, y)
             
         # Add new ball when point is scored (if no balls left, always add one)
         if point_scored or len(self.balls) == 0: